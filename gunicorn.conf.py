@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration for the Yolwise Lead Scoring API.
+Loaded automatically by `gunicorn main:app` from the project root.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Scoring is CPU-bound: one process per core (WEB_CONCURRENCY overrides).
+# Exported so main.py sizes its batch pool to each worker's share of the cores:
+# at the default of one worker per core that share is 1, so large batches are
+# scored in-process and parallelism comes from the workers. Set WEB_CONCURRENCY
+# below the core count to shard large /score_batch calls across a process pool.
+workers = int(os.environ.setdefault('WEB_CONCURRENCY', str(os.cpu_count() or 1)))
+
+# gthread by default; WORKER_CLASS=gevent for many concurrent, I/O-bound clients
+worker_class = os.environ.get('WORKER_CLASS', 'gthread')
+threads = 4
+worker_connections = 1000
+
+# Import main.py once in the master; workers fork with the scoring engine,
+# keyword automaton and static responses already built (shared copy-on-write).
+# Not with gevent, which must monkey-patch before the app is imported.
+preload_app = worker_class != 'gevent'
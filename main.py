@@ -11,13 +11,175 @@ import os
 import json
 import time
 import re
+import bisect
 import functools
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-from flask import Flask, request, jsonify, abort
+import heapq
+import hashlib
+import hmac
+import itertools
+import math
+import operator
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterator, List, Any, Optional
+from dataclasses import dataclass
+from flask import Flask, Request, Response, request, jsonify, abort, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.exceptions import HTTPException
 
+# Optional accelerator: single-pass multi-keyword matching (pyahocorasick)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional accelerator: C-backed JSON encoding/decoding (orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional accelerator: incremental parsing of large batch payloads (ijson)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Precompiled numeric extraction patterns (hot path in batch scoring)
+_FLOAT_RE = re.compile(r'\d+\.?\d*')
+_INT_RE = re.compile(r'\d+')
+_NUM_RE = re.compile(r'(\d+(?:\.\d+)?)')
+_WORD_RE = re.compile(r'\w+')
+
+# Formal Turkish company structure markers, one alternation instead of an any() scan
+_FORMAL_STRUCTURE_RE = re.compile('|'.join(
+    re.escape(term) for term in ('a.ş.', 'anonim şirket', 'limited şirket', 'ltd.', 'şti.')))
+
+# Company size bucket tables (bisect_right: value >= threshold[i] earns scores[i + 1])
+_EMPLOYEE_THRESHOLDS = (1, 50, 200, 1000, 5000)
+_EMPLOYEE_SCORES = (0, 5, 10, 15, 25, 30)       # 28.1% .. 71.9% target rates
+_REVENUE_THRESHOLDS = (20000000, 100000000, 200000000, 1000000000)  # TL
+_REVENUE_SCORES = (3, 10, 15, 20, 25)           # for revenue > 0: 20% .. 70.3% target rates
+
+# Company-age buckets as founding-year cutoffs (current year resolved once at startup)
+_CURRENT_YEAR = time.gmtime().tm_year
+_FOUNDED_CUTOFFS = (_CURRENT_YEAR - 20, _CURRENT_YEAR - 10, _CURRENT_YEAR - 5)
+_FOUNDED_SCORES = (25, 20, 15, 5)               # established, growing, young, startup
+
+# Companies with more text than this (name, industry, description, city) bypass the
+# scoring/detection LRU caches, bounding what 4096 cached entries can retain per process
+MAX_CACHED_TEXT_LENGTH = 2048
+
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    Used by jsonify() and request.json; honors the sort_keys/compact settings
+    of the default provider and its fallback serializer for non-native types.
+    """
+
+    def _options(self) -> int:
+        option = 0
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if self.compact is False or (self.compact is None and self._app.debug):
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode('utf-8')
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._options())
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+# Streaming /score_batch variant (requested with Accept: application/x-ndjson)
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+def _wants_ndjson(req: Request) -> bool:
+    """
+    True when the client explicitly accepts an NDJSON batch response.
+    A wildcard such as */* does not opt in, and q=0 opts out.
+    """
+    return any(mimetype == NDJSON_MIMETYPE and quality > 0 for mimetype, quality in req.accept_mimetypes)
+
+
+class YolwiseRequest(Request):
+    """Request whose body-size cap does not apply to streamed NDJSON batches"""
+
+    @property
+    def max_content_length(self) -> Optional[int]:
+        # Streamed batches are parsed incrementally (with ijson), so their size is not bounded
+        # by memory; without ijson the body is buffered and stays capped
+        if ijson is not None and self.endpoint == 'score_batch' and _wants_ndjson(self):
+            return None
+        return super().max_content_length
+
+
 app = Flask(__name__)
+app.request_class = YolwiseRequest
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Compact, unsorted JSON responses (no indent or key-sort pass on batch payloads)
+app.json.compact = True
+app.json.sort_keys = False
+
+# Reject oversized buffered request bodies with 413 before any JSON parsing or scoring
+# (NDJSON /score_batch streams are exempt, see YolwiseRequest)
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('MAX_CONTENT_LENGTH', 16 * 1024 * 1024))
+
+
+def _as_text(value: Any) -> str:
+    """Field value as text: str passes through untouched, None/missing becomes ''"""
+    if type(value) is str:
+        return value
+    return '' if value is None else str(value)
+
+
+def _slower(value: Any) -> str:
+    """Lowercased field text without re-stringifying str values; None/missing becomes ''"""
+    if type(value) is str:
+        return value.lower()
+    return '' if value is None else str(value).lower()
+
+
+# Request validation (hand-written: one pass over the fields, no schema objects)
+MAX_COMPANY_NAME_LENGTH = 200
+
+
+class CompanyValidationError(ValueError):
+    """Invalid company payload (reported as 400 / batch error entry)"""
+
+
+def validate_company(company_name: Any, company_data: Any) -> tuple:
+    """Validate one company payload; returns (company_name, company_data)"""
+    if not company_name:
+        raise CompanyValidationError("company_name is required")
+    if not isinstance(company_name, str):
+        raise CompanyValidationError("company_name must be a string")
+    if len(company_name) > MAX_COMPANY_NAME_LENGTH:
+        raise CompanyValidationError(f"company_name must be at most {MAX_COMPANY_NAME_LENGTH} characters")
+
+    if company_data is None:
+        company_data = {}
+    elif not isinstance(company_data, dict):
+        raise CompanyValidationError("company_data must be a JSON object")
+
+    return company_name, company_data
+
+
+# Expected API key, read once at startup (Context7 environment pattern)
+_EXPECTED_API_KEY = os.environ.get('YOLWISE_API_KEY')
 
 
 # API Key Authentication Decorator (Context7 Flask Pattern)
@@ -25,14 +187,11 @@ def require_api_key(f):
     """
     API key authentication decorator following Context7 Flask patterns.
     Checks for API key in X-API-Key header or api_key query parameter.
-    Validates against YOLWISE_API_KEY environment variable.
+    Validates against YOLWISE_API_KEY environment variable (constant-time compare).
     """
     @functools.wraps(f)
     def decorated_function(*args, **kwargs):
-        # Get expected API key from environment (Context7 pattern)
-        expected_api_key = os.environ.get('YOLWISE_API_KEY')
-        
-        if not expected_api_key:
+        if not _EXPECTED_API_KEY:
             abort(500, description="Server configuration error: API key not configured")
         
         # Check X-API-Key header (Context7 Flask request pattern)
@@ -42,15 +201,16 @@ def require_api_key(f):
         if not provided_api_key:
             provided_api_key = request.args.get('api_key')
         
-        # Validate API key (Context7 authentication pattern)
-        if not provided_api_key or provided_api_key != expected_api_key:
+        # Validate API key without leaking the mismatch position through timing
+        if not provided_api_key or not hmac.compare_digest(
+                provided_api_key.encode('utf-8'), _EXPECTED_API_KEY.encode('utf-8')):
             abort(401, description="Unauthorized: Valid API key required")
         
         return f(*args, **kwargs)
     return decorated_function
 
 
-@dataclass
+@dataclass(slots=True)
 class CompanyScore:
     """Mathematical scoring result for Turkish B2B market"""
     company_name: str
@@ -66,6 +226,43 @@ class CompanyScore:
     industry_explanation: str
     score_breakdown: Dict[str, float]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow response dict (no recursive deep copy as with dataclasses.asdict)"""
+        return {
+            'company_name': self.company_name,
+            'base_score': self.base_score,
+            'industry_multiplier': self.industry_multiplier,
+            'industry_adjusted_score': self.industry_adjusted_score,
+            'detected_industry': self.detected_industry,
+            'industry_confidence': self.industry_confidence,
+            'processing_time_ms': self.processing_time_ms,
+            'priority_recommendation': self.priority_recommendation,
+            'industry_explanation': self.industry_explanation,
+            'score_breakdown': self.score_breakdown
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class NormalizedCompany:
+    """Company fields normalized once per score (lowercased text, parsed numbers); hashable cache key"""
+    name_lc: str
+    industry_lc: str
+    description_lc: str
+    description_length: int
+    city_lc: str
+    employees: int
+    revenue: float
+    year_founded: float
+    has_formal_structure: bool
+    has_domain: bool
+    has_phone: bool
+
+
+def _is_cacheable(company: NormalizedCompany) -> bool:
+    """True when the company's text is short enough to keep as an LRU cache key"""
+    return (len(company.name_lc) + len(company.industry_lc) + len(company.description_lc)
+            + len(company.city_lc)) <= MAX_CACHED_TEXT_LENGTH
+
 
 class YolwiseScoring:
     """
@@ -168,6 +365,55 @@ class YolwiseScoring:
             }
         }
 
+        # Struct-of-arrays view of industry_modifiers for the detection hot path,
+        # indexed by declaration order (keyword weights: longer keywords = higher score)
+        self._industry_names = tuple(self.industry_modifiers)
+        self._industry_multipliers = tuple(info['multiplier'] for info in self.industry_modifiers.values())
+        self._industry_confidences = tuple(info['confidence'] for info in self.industry_modifiers.values())
+        self._industry_keywords = tuple(
+            tuple((keyword, len(keyword) * (2 if len(keyword) > 5 else 1)) for keyword in info['keywords'])
+            for info in self.industry_modifiers.values()
+        )
+
+        # Single-pass keyword matcher over all industries (None when pyahocorasick is missing)
+        self._keyword_automaton = self._build_keyword_automaton()
+
+        # Fallback prefilter: leading trigrams of each industry's keywords
+        # (None when a keyword is too short to be prefiltered safely)
+        self._industry_trigrams = tuple(
+            frozenset(keyword[:3] for keyword, _ in keywords)
+            if all(len(keyword) >= 3 for keyword, _ in keywords) else None
+            for keywords in self._industry_keywords
+        )
+
+        # Canonical industry labels (ids, ids with spaces, CRM display names) that
+        # resolve directly to their industry without a keyword scan
+        industry_labels = {
+            'renewables & environment': 'renewables_environment',
+            'logistics and supply chain': 'logistics_supply_chain',
+            'food & beverages': 'food_beverages',
+            'mechanical or industrial engineering': 'mechanical_industrial',
+            'mechanical/industrial eng.': 'mechanical_industrial',
+            'mining & metals': 'mining_metals',
+            'hospital & health care': 'hospital_healthcare',
+            'transportation/trucking/railroad': 'transportation_trucking',
+            'transportation/trucking': 'transportation_trucking'
+        }
+        self._canonical_industries = {}
+        for index, name in enumerate(self._industry_names):
+            self._canonical_industries[name] = index
+            self._canonical_industries[name.replace('_', ' ')] = index
+        for label, name in industry_labels.items():
+            self._canonical_industries[label] = self._industry_names.index(name)
+
+        # Memoized industry detection keyed by the normalized text fields
+        # (re-scored and duplicate companies skip the keyword scan)
+        self._detect_industry_cached = functools.lru_cache(maxsize=4096)(self._detect_industry_text)
+
+        # Memoized scoring keyed by the whole normalized company
+        # (duplicate rows differing only in case, types or unused fields)
+        self._score_normalized_cached = functools.lru_cache(maxsize=4096)(self._score_normalized)
+
         # Turkish geographic tiers
         self.city_tiers = {
             'tier_1_cities': ['istanbul', 'ankara', 'izmir'],
@@ -176,6 +422,42 @@ class YolwiseScoring:
             'industrial_regions': ['kocaeli', 'tekirdağ', 'gebze', 'sakarya', 'çorlu', 'manisa']
         }
 
+        # City tiers as frozensets with their bonus, checked in tier order
+        tier_bonuses = {
+            'tier_1_cities': 30,       # Istanbul, Ankara, Izmir
+            'tier_2_cities': 25,       # Major cities
+            'tier_3_cities': 20,       # Regional centers
+            'industrial_regions': 22   # Industrial zones
+        }
+        self._city_tier_sets = tuple(
+            (frozenset(cities), tier_bonuses[tier]) for tier, cities in self.city_tiers.items()
+        )
+
+        # Industry B2B propensity vocabularies (substring match on the industry field)
+        self.b2b_propensity_terms = {
+            'high_b2b': [
+                'renewable', 'logistics', 'utilities', 'manufacturing', 'energy',
+                'chemical', 'industrial', 'engineering', 'construction materials'
+            ],
+            'medium_b2b': [
+                'food', 'pharmaceutical', 'building', 'automotive', 'mining',
+                'metals', 'machinery', 'equipment'
+            ],
+            'low_b2b': [
+                'retail', 'consumer', 'software', 'it', 'healthcare', 'hospital',
+                'transportation', 'trucking'
+            ]
+        }
+        propensity_scores = {'high_b2b': 85, 'medium_b2b': 60, 'low_b2b': 25}
+
+        # One precompiled alternation per bucket replaces the per-term scans
+        self._propensity_patterns = tuple(
+            (re.compile('|'.join(re.escape(term) for term in terms)), propensity_scores[bucket])
+            for bucket, terms in self.b2b_propensity_terms.items()
+        )
+        self._min_propensity_term_length = min(
+            len(term) for terms in self.b2b_propensity_terms.values() for term in terms)
+
         # Mathematical scoring weights
         self.scoring_weights = {
             'company_size_indicator': 0.35,
@@ -187,16 +469,42 @@ class YolwiseScoring:
 
     def calculate_score(self, company_name: str, company_data: Dict[str, Any]) -> CompanyScore:
         """Main mathematical scoring method - NO LLM logic"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+
+        # 0. Single normalization pass shared by all evaluators
+        company = self._normalize(company_name, company_data)
+
+        # 1-4. Scoring (LRU-cached on the normalized company unless its text is long)
+        score_normalized = self._score_normalized_cached if _is_cacheable(company) else self._score_normalized
+        (base_components, base_score, industry, multiplier, confidence,
+         industry_adjusted_score, priority_recommendation) = score_normalized(company)
+
+        processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+        return CompanyScore(
+            company_name=company_name,
+            base_score=round(base_score, 1),
+            industry_multiplier=multiplier,
+            industry_adjusted_score=round(industry_adjusted_score, 1),
+            detected_industry=industry,
+            industry_confidence=confidence,
+            processing_time_ms=processing_time,
+            priority_recommendation=priority_recommendation,
+            industry_explanation=self._get_industry_explanation(industry),
+            score_breakdown=dict(base_components)  # callers own their copy
+        )
+
+    def _score_normalized(self, company: NormalizedCompany) -> tuple:
+        """Uncached scoring of a normalized company"""
 
         # 1. Base mathematical scoring
-        base_components = self._calculate_base_components(company_data)
+        base_components = self._calculate_base_components(company)
         base_score = sum(score * weight for score, weight in zip(
             base_components.values(), self.scoring_weights.values()))
         base_score = max(0, min(100, base_score))
 
         # 2. Industry detection and multiplication (mathematical)
-        industry, multiplier, confidence = self._detect_industry(company_name, company_data)
+        industry, multiplier, confidence = self._detect_industry(company)
 
         # 3. Apply industry mathematical modifier
         industry_adjusted_score = base_score * multiplier
@@ -205,199 +513,219 @@ class YolwiseScoring:
         # 4. Mathematical priority recommendation (threshold-based)
         priority_recommendation = "target" if industry_adjusted_score >= 60 else "non_target"
 
-        processing_time = int((time.time() - start_time) * 1000)
+        return (base_components, base_score, industry, multiplier, confidence,
+                industry_adjusted_score, priority_recommendation)
 
-        return CompanyScore(
-            company_name=company_name,
-            base_score=round(base_score, 1),
-            industry_multiplier=multiplier,
-            industry_adjusted_score=round(industry_adjusted_score, 1),
-            detected_industry=industry,
-            industry_confidence=confidence,
-            processing_time_ms=processing_time,
-            priority_recommendation=priority_recommendation,
-            industry_explanation=self._get_industry_explanation(industry),
-            score_breakdown=base_components
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters of the scoring and industry-detection LRU caches (this process)"""
+        return {
+            name: cache.cache_info()._asdict()
+            for name, cache in (('score', self._score_normalized_cached),
+                                ('industry_detection', self._detect_industry_cached))
+        }
+
+    def _normalize(self, company_name: str, data: Dict[str, Any]) -> NormalizedCompany:
+        """Stringify, lowercase and parse every field the evaluators read, exactly once"""
+        description = _as_text(data.get('description'))
+        registered_name = _slower(data.get('company_name'))
+
+        return NormalizedCompany(
+            name_lc=company_name.lower(),
+            industry_lc=_slower(data.get('industry')),
+            description_lc=description.lower(),
+            description_length=len(description),
+            city_lc=_slower(data.get('city', data.get('headquarters'))),
+            employees=self._extract_number(data.get('number_of_employees', data.get('employees_estimate', 0))),
+            revenue=self._safe_float(data.get('annual_revenue', data.get('revenue_estimate', 0))),
+            year_founded=self._safe_float(data.get('year_founded', 0)),
+            has_formal_structure=_FORMAL_STRUCTURE_RE.search(registered_name) is not None,
+            has_domain=bool(data.get('company_domain_name')),
+            has_phone=bool(data.get('phone_number'))
         )
 
-    def _calculate_base_components(self, data: Dict[str, Any]) -> Dict[str, float]:
+    def _calculate_base_components(self, company: NormalizedCompany) -> Dict[str, float]:
         """Calculate mathematical base components"""
         return {
-            'company_size_score': self._evaluate_company_size(data),
-            'industry_propensity_score': self._evaluate_industry_propensity(data),
-            'financial_capacity_score': self._evaluate_financial_capacity(data),
-            'geographic_score': self._evaluate_geographic_presence(data),
-            'additional_score': self._evaluate_additional_indicators(data)
+            'company_size_score': self._evaluate_company_size(company),
+            'industry_propensity_score': self._evaluate_industry_propensity(company),
+            'financial_capacity_score': self._evaluate_financial_capacity(company),
+            'geographic_score': self._evaluate_geographic_presence(company),
+            'additional_score': self._evaluate_additional_indicators(company)
         }
 
-    def _evaluate_company_size(self, data: Dict[str, Any]) -> float:
+    def _evaluate_company_size(self, company: NormalizedCompany) -> float:
         """Company Size Mathematical Evaluation (35% weight)"""
         score = 30  # Base score
 
-        # Employee count mathematical evaluation
-        employees = self._extract_number(data.get('number_of_employees', data.get('employees_estimate', 0)))
-        if employees >= 5000:
-            score += 30  # 71.9% target rate
-        elif employees >= 1000:
-            score += 25  # 65.3% target rate
-        elif employees >= 200:
-            score += 15  # 39.4% target rate
-        elif employees >= 50:
-            score += 10  # 28.2% target rate
-        elif employees >= 1:
-            score += 5   # 28.1% target rate
+        # Employee count mathematical evaluation (bucket table lookup)
+        score += _EMPLOYEE_SCORES[bisect.bisect_right(_EMPLOYEE_THRESHOLDS, company.employees)]
 
         # Revenue mathematical evaluation (Turkish Lira context)
-        revenue = self._safe_float(data.get('annual_revenue', data.get('revenue_estimate', 0)))
-        if revenue >= 1000000000:  # 1B+ TL
-            score += 25  # 70.3% target rate
-        elif revenue >= 200000000:  # 200-1000M TL
-            score += 20  # 60.5% target rate
-        elif revenue >= 100000000:   # 100-200M TL
-            score += 15  # 50% target rate
-        elif revenue >= 20000000:   # 20-100M TL
-            score += 10  # 36.4% target rate
-        elif revenue > 0:
-            score += 3   # <20M TL - 20% target rate
+        revenue = company.revenue
+        if revenue > 0:
+            score += _REVENUE_SCORES[bisect.bisect_right(_REVENUE_THRESHOLDS, revenue)]
 
         return min(score, 100)
 
-    def _evaluate_industry_propensity(self, data: Dict[str, Any]) -> float:
+    def _evaluate_industry_propensity(self, company: NormalizedCompany) -> float:
         """Mathematical industry B2B propensity evaluation (25% weight)"""
-        industry = str(data.get('industry', '')).lower()
-
-        # Mathematical classification by B2B service potential
-        high_b2b = [
-            'renewable', 'logistics', 'utilities', 'manufacturing', 'energy',
-            'chemical', 'industrial', 'engineering', 'construction materials'
-        ]
-        medium_b2b = [
-            'food', 'pharmaceutical', 'building', 'automotive', 'mining',
-            'metals', 'machinery', 'equipment'
-        ]
-        low_b2b = [
-            'retail', 'consumer', 'software', 'it', 'healthcare', 'hospital',
-            'transportation', 'trucking'
-        ]
-
-        for high_term in high_b2b:
-            if high_term in industry:
-                return 85
-
-        for medium_term in medium_b2b:
-            if medium_term in industry:
-                return 60
-
-        for low_term in low_b2b:
-            if low_term in industry:
-                return 25
+        industry = company.industry_lc
+
+        # Length prefilter: shorter than every vocabulary term
+        if len(industry) < self._min_propensity_term_length:
+            return 40
+
+        # Mathematical classification by B2B service potential (first bucket hit wins)
+        for pattern, score in self._propensity_patterns:
+            if pattern.search(industry):
+                return score
 
         return 40  # Default for unclassified
 
-    def _evaluate_financial_capacity(self, data: Dict[str, Any]) -> float:
+    def _evaluate_financial_capacity(self, company: NormalizedCompany) -> float:
         """Mathematical financial capacity evaluation (20% weight)"""
         score = 30  # Base score
 
         # Company age mathematical indicator
-        year_founded = self._safe_float(data.get('year_founded', 0))
+        year_founded = company.year_founded
         if year_founded > 0:
-            age = 2025 - year_founded
-            if age >= 20:
-                score += 25  # Established company
-            elif age >= 10:
-                score += 20  # Growing company
-            elif age >= 5:
-                score += 15  # Young company
-            else:
-                score += 5   # Startup
+            score += _FOUNDED_SCORES[bisect.bisect_left(_FOUNDED_CUTOFFS, year_founded)]
 
         # Company structure mathematical evaluation
-        company_name = str(data.get('company_name', '')).lower()
-        if any(term in company_name for term in ['a.ş.', 'anonim şirket', 'limited şirket', 'ltd.', 'şti.']):
+        if company.has_formal_structure:
             score += 20  # Formal company structure
 
         # Domain presence (mathematical indicator of establishment)
-        if data.get('company_domain_name'):
+        if company.has_domain:
             score += 15
 
         return min(score, 100)
 
-    def _evaluate_geographic_presence(self, data: Dict[str, Any]) -> float:
+    def _evaluate_geographic_presence(self, company: NormalizedCompany) -> float:
         """Mathematical geographic evaluation for Turkish market (10% weight)"""
         score = 40  # Base score for Turkish market
 
-        city = str(data.get('city', data.get('headquarters', ''))).lower()
-        
-        # Mathematical tier-based scoring
-        if any(tier1 in city for tier1 in self.city_tiers['tier_1_cities']):
-            score += 30  # Istanbul, Ankara, Izmir
-        elif any(tier2 in city for tier2 in self.city_tiers['tier_2_cities']):
-            score += 25  # Major cities
-        elif any(tier3 in city for tier3 in self.city_tiers['tier_3_cities']):
-            score += 20  # Regional centers
-        elif any(industrial in city for industrial in self.city_tiers['industrial_regions']):
-            score += 22  # Industrial zones
+        # Mathematical tier-based scoring on whole city tokens
+        # ("kocaeli/gebze", "istanbul bölgesi"); first matching tier wins
+        tokens = set(_WORD_RE.findall(company.city_lc))
+        for tier_cities, bonus in self._city_tier_sets:
+            if not tier_cities.isdisjoint(tokens):
+                score += bonus
+                break
         else:
             score += 10  # Other locations
 
         return min(score, 100)
 
-    def _evaluate_additional_indicators(self, data: Dict[str, Any]) -> float:
+    def _evaluate_additional_indicators(self, company: NormalizedCompany) -> float:
         """Mathematical additional indicators (10% weight)"""
         score = 30  # Base score
 
         # Description completeness (mathematical data quality indicator)
-        description = str(data.get('description', ''))
-        if len(description) > 100:
+        description_length = company.description_length
+        if description_length > 100:
             score += 25
-        elif len(description) > 50:
+        elif description_length > 50:
             score += 15
-        elif len(description) > 0:
+        elif description_length > 0:
             score += 10
 
         # Contact information completeness (mathematical indicator)
         contact_score = 0
-        if data.get('phone_number'):
+        if company.has_phone:
             contact_score += 15
-        if data.get('company_domain_name'):
+        if company.has_domain:
             contact_score += 15
         
         score += contact_score
 
         return min(score, 100)
 
-    def _detect_industry(self, company_name: str, company_data: Dict[str, Any]) -> tuple:
-        """Mathematical industry detection using keyword matching"""
+    def _build_keyword_automaton(self):
+        """Build Aho-Corasick automaton mapping each keyword to its (industry index, weight) hits"""
+        if ahocorasick is None:
+            return None
+
+        keyword_hits = {}
+        for index, keywords in enumerate(self._industry_keywords):
+            for keyword, weight in keywords:
+                keyword_hits.setdefault(keyword, []).append((index, weight))
+
+        automaton = ahocorasick.Automaton()
+        for keyword, hits in keyword_hits.items():
+            automaton.add_word(keyword, (keyword, tuple(hits)))
+        automaton.make_automaton()
+        return automaton
+
+    def _detect_industry(self, company: NormalizedCompany) -> tuple:
+        """Mathematical industry detection using keyword matching (LRU-cached)"""
+        # A canonical industry field is taken as-is (no keyword scan)
+        index = self._canonical_industries.get(company.industry_lc.strip())
+        if index is not None:
+            return (self._industry_names[index],
+                    self._industry_multipliers[index],
+                    self._industry_confidences[index])
+
+        detect = self._detect_industry_cached if _is_cacheable(company) else self._detect_industry_text
+        return detect(company.name_lc, company.industry_lc, company.description_lc)
+
+    def _detect_industry_text(self, name_lc: str, industry_lc: str, description_lc: str) -> tuple:
+        """Uncached industry detection over the lowercased text fields"""
         
-        # Combine text data for analysis
-        text_data = [
-            company_name.lower(),
-            str(company_data.get('industry', '')).lower(),
-            str(company_data.get('description', '')).lower()
-        ]
-        combined_text = ' '.join(text_data)
-
-        # Mathematical keyword matching with scoring
-        best_match = None
-        max_score = 0
+        # Fields are scanned one by one (no combined copy of the text)
+        texts = (name_lc, industry_lc, description_lc)
+
+        if self._keyword_automaton is not None:
+            industry_scores = self._score_industries_automaton(texts)
+        else:
+            industry_scores = self._score_industries_scan(texts)
 
-        for industry_name, industry_info in self.industry_modifiers.items():
-            score = 0
-            for keyword in industry_info['keywords']:
-                if keyword in combined_text:
-                    # Mathematical weight: longer keywords = higher score
-                    score += len(keyword) * (2 if len(keyword) > 5 else 1)
+        # Best match in declaration order (first industry wins ties)
+        best_index = -1
+        max_score = 0
 
+        for index, score in enumerate(industry_scores):
             if score > max_score:
                 max_score = score
-                best_match = industry_name
+                best_index = index
 
-        if best_match and max_score > 0:
-            industry_data = self.industry_modifiers[best_match]
-            return best_match, industry_data['multiplier'], industry_data['confidence']
+        if best_index >= 0:
+            return (self._industry_names[best_index],
+                    self._industry_multipliers[best_index],
+                    self._industry_confidences[best_index])
         else:
             return 'other', 1.0, 'low'
 
+    def _score_industries_automaton(self, texts: tuple) -> List[int]:
+        """Single pass over each field; each distinct keyword counts once across fields"""
+        matched_keywords = {}
+        for text in texts:
+            matched_keywords.update(payload for _, payload in self._keyword_automaton.iter(text))
+
+        industry_scores = [0] * len(self._industry_names)
+        for hits in matched_keywords.values():
+            for index, weight in hits:
+                industry_scores[index] += weight
+        return industry_scores
+
+    def _score_industries_scan(self, texts: tuple) -> List[int]:
+        """Fallback keyword scan when pyahocorasick is not installed"""
+        industry_scores = [0] * len(self._industry_names)
+        name_lc, industry_lc, description_lc = texts
+        text_trigrams = {text[i:i + 3] for text in texts for i in range(len(text) - 2)}
+
+        for index, keywords in enumerate(self._industry_keywords):
+            # Skip industries none of whose keywords can start anywhere in the text
+            trigrams = self._industry_trigrams[index]
+            if trigrams is not None and trigrams.isdisjoint(text_trigrams):
+                continue
+
+            for keyword, weight in keywords:
+                if keyword in name_lc or keyword in industry_lc or keyword in description_lc:
+                    industry_scores[index] += weight
+
+        return industry_scores
+
     def _get_industry_explanation(self, industry: str) -> str:
         """Generate explanation for mathematical industry modifier"""
         if industry in self.industry_modifiers:
@@ -412,8 +740,8 @@ class YolwiseScoring:
             if isinstance(value, (int, float)):
                 return float(value)
             elif isinstance(value, str):
-                numbers = re.findall(r'\d+\.?\d*', str(value))
-                return float(numbers[0]) if numbers else 0
+                number = _FLOAT_RE.search(value)
+                return float(number.group()) if number else 0
             else:
                 return 0
         except (ValueError, TypeError, AttributeError):
@@ -425,21 +753,22 @@ class YolwiseScoring:
             if isinstance(text, (int, float)):
                 return int(text)
             
-            text_str = str(text).strip().lower()
+            # Whitespace never affects the substring/regex checks below, so no strip()
+            text_str = _slower(text)
             
             # Handle Turkish number formats
             if 'bin' in text_str or 'k' in text_str:
-                number = re.search(r'(\d+(?:\.\d+)?)', text_str)
+                number = _NUM_RE.search(text_str)
                 if number:
                     return int(float(number.group(1)) * 1000)
             elif 'milyon' in text_str or 'm' in text_str:
-                number = re.search(r'(\d+(?:\.\d+)?)', text_str)  
+                number = _NUM_RE.search(text_str)
                 if number:
                     return int(float(number.group(1)) * 1000000)
             
             # Extract first complete number
-            numbers = re.findall(r'\d+', text_str)
-            return int(numbers[0]) if numbers else 0
+            number = _INT_RE.search(text_str)
+            return int(number.group()) if number else 0
         except (ValueError, TypeError, AttributeError):
             return 0
 
@@ -447,6 +776,228 @@ class YolwiseScoring:
 # Initialize mathematical scoring engine
 scoring_engine = YolwiseScoring()
 
+# Batches above this size are scored in a process pool sized to this server
+# process's share of the cores (gunicorn runs WEB_CONCURRENCY processes). With the
+# default WEB_CONCURRENCY=cpu_count that share is one core, so there is no pool and
+# batches are scored in-process; sharding engages only with fewer workers than cores
+# (or under DEV, which runs a single process)
+PARALLEL_BATCH_THRESHOLD = 500
+BATCH_POOL_WORKERS = max(1, (os.cpu_count() or 1) // int(os.environ.get('WEB_CONCURRENCY', 1)))
+_batch_pool = None
+_batch_pool_lock = threading.Lock()
+
+
+def _get_batch_pool() -> ProcessPoolExecutor:
+    """Lazily create the batch scoring process pool (once per server process)"""
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            # forkserver: children are not forked from a multithreaded gthread worker
+            _batch_pool = ProcessPoolExecutor(max_workers=BATCH_POOL_WORKERS,
+                                              mp_context=multiprocessing.get_context('forkserver'))
+        return _batch_pool
+
+
+def _reset_batch_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next large batch starts a fresh one"""
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is pool:
+            _batch_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _score_batch_companies(companies: List[Any]) -> List[Dict[str, Any]]:
+    """Score batch entries; large batches are sharded across the pool, small ones stay in-process"""
+    if len(companies) <= PARALLEL_BATCH_THRESHOLD or BATCH_POOL_WORKERS == 1:
+        return _score_batch_shard(companies)
+
+    shard_size = math.ceil(len(companies) / BATCH_POOL_WORKERS)
+    shards = [companies[i:i + shard_size] for i in range(0, len(companies), shard_size)]
+    pool = _get_batch_pool()
+    try:
+        return [entry for shard in pool.map(_score_batch_shard, shards) for entry in shard]
+    except BrokenProcessPool:
+        # A pool child died (OOM kill, signal): replace the pool, score this batch in-process
+        _reset_batch_pool(pool)
+        return _score_batch_shard(companies)
+
+
+def _json_payload() -> Dict[str, Any]:
+    """Parsed JSON object body of a scoring request (400 when missing or not an object)"""
+    data = request.json
+    if not data or not isinstance(data, dict):
+        abort(400, description="JSON payload required")
+    return data
+
+
+def _score_batch_entry(company_info: Any) -> Optional[Dict[str, Any]]:
+    """Score one /score_batch entry; None when the entry is skipped"""
+    company_name = 'Unknown'
+    try:
+        # Handle different input formats
+        if isinstance(company_info, str):
+            company_name = company_info
+            company_data = {}
+        elif isinstance(company_info, dict):
+            company_name = company_info.get('name', company_info.get('company_name', ''))
+            company_data = company_info.get('data', company_info)
+        else:
+            return None
+
+        if not company_name:
+            return None
+
+        company_name, company_data = validate_company(company_name, company_data)
+
+        # Mathematical scoring
+        result = scoring_engine.calculate_score(company_name, company_data)
+
+        return {
+            'company_name': result.company_name,
+            'base_score': result.base_score,
+            'industry_adjusted_score': result.industry_adjusted_score,
+            'priority_recommendation': result.priority_recommendation,
+            'detected_industry': result.detected_industry,
+            'industry_multiplier': result.industry_multiplier,
+            'confidence': result.industry_confidence
+        }
+
+    except CompanyValidationError as e:
+        error = str(e)
+    except Exception:
+        # Details go to the server log only; the row gets a fixed message
+        app.logger.exception("Scoring failed for batch entry")
+        error = "Scoring failed"
+
+    return {
+        'company_name': company_name,
+        'base_score': 0,
+        'industry_adjusted_score': 0,
+        'priority_recommendation': 'error',
+        'error': error
+    }
+
+
+def _score_batch_shard(shard: List[Any]) -> List[Dict[str, Any]]:
+    """Score a slice of batch entries (top-level so worker processes can run it)"""
+    results = []
+    for company_info in shard:
+        entry = _score_batch_entry(company_info)
+        if entry is not None:
+            results.append(entry)
+    return results
+
+
+# Streamed /score_batch parsing (see _wants_ndjson)
+_STREAM_PARSE_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
+
+
+class _RequestBodyReader:
+    """Plain read() view of the request stream (werkzeug's LimitedStream treats read(0) as a disconnect)"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size) if size else b''
+
+
+def _open_batch_companies() -> Iterator[Any]:
+    """
+    Check the /score_batch envelope before streaming starts (same 400s as the buffered
+    path), then return the raw entries, stream-parsed when ijson is available
+    """
+    if ijson is None:
+        companies = _json_payload().get('companies', [])
+        if not isinstance(companies, list) or not companies:
+            abort(400, description="companies list is required and cannot be empty")
+        return iter(companies)
+
+    # Same Content-Type rule (and message) as request.json on the buffered path
+    if not request.is_json:
+        abort(415, description="Did not attempt to load JSON data because the request "
+                               "Content-Type was not 'application/json'.")
+
+    events = ijson.parse(_RequestBodyReader(request.stream), use_float=True)
+    try:
+        if next(events, None) != ('', 'start_map', None):
+            abort(400, description="JSON payload required")
+
+        # Skip top-level keys up to 'companies'; an empty object is rejected like request.json's {}
+        seen_key = False
+        for prefix, event, value in events:
+            if prefix == '' and event == 'map_key':
+                if value == 'companies':
+                    break
+                seen_key = True
+            elif prefix == '' and event == 'end_map':
+                if not seen_key:
+                    abort(400, description="JSON payload required")
+                break
+
+        # The list must be present and non-empty; its first event is pushed back below
+        head = (next(events, None), next(events, None))
+        if head[0] != ('companies', 'start_array', None) or head[1] is None or head[1][1] == 'end_array':
+            abort(400, description="companies list is required and cannot be empty")
+    except _STREAM_PARSE_ERRORS as e:
+        abort(400, description=f"Invalid JSON payload: {e}")
+
+    return ijson.items(itertools.chain(head, events), 'companies.item')
+
+
+def _stream_batch_ndjson() -> Response:
+    """
+    Score a batch while it is being received: one NDJSON result line per company
+    (input order), followed by a final summary line. Peak memory stays bounded by
+    the top-10 target heap instead of the full companies/results lists.
+    """
+    companies = _open_batch_companies()
+
+    def generate():
+        start_ns = time.perf_counter_ns()
+        total_count = 0
+        target_count = 0
+        top_targets = []  # min-heap of (score, -position, entry), at most 10 items
+
+        try:
+            for position, company_info in enumerate(companies):
+                entry = _score_batch_entry(company_info)
+                if entry is None:
+                    continue
+
+                total_count += 1
+                if entry['priority_recommendation'] == 'target':
+                    target_count += 1
+                    item = (entry['industry_adjusted_score'], -position, entry)
+                    if len(top_targets) < 10:
+                        heapq.heappush(top_targets, item)
+                    else:
+                        heapq.heappushpop(top_targets, item)
+
+                yield app.json.dumps(entry) + '\n'
+        except _STREAM_PARSE_ERRORS as e:
+            yield app.json.dumps({'success': False, 'error': f"Invalid JSON payload: {e}"}) + '\n'
+            return
+
+        yield app.json.dumps({
+            'success': True,
+            'summary': {
+                'total_companies': total_count,
+                'target_recommendations': target_count,
+                'non_target_recommendations': total_count - target_count,
+                'processing_time_ms': (time.perf_counter_ns() - start_ns) // 1_000_000,
+                'top_targets': [item[2] for item in sorted(top_targets, reverse=True)]
+            },
+            'metadata': {
+                'api_version': '2.0-mathematical',
+                'scoring_type': 'mathematical_only',
+                'target_threshold': 60
+            }
+        }) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
 
 # Flask Error Handlers (from Context7 Flask documentation)
 @app.errorhandler(HTTPException)
@@ -461,13 +1012,12 @@ def handle_exception(e):
 
 @app.errorhandler(Exception)
 def handle_generic_exception(e):
-    """Handle non-HTTP exceptions"""
-    if isinstance(e, HTTPException):
-        return e
-
+    """Handle non-HTTP exceptions (HTTPException is dispatched to handle_exception)"""
+    # Details go to the server log only; clients get a fixed message
+    app.logger.exception("Unhandled exception")
     return jsonify({
         "error": "Internal Server Error",
-        "message": str(e),
+        "message": "An unexpected error occurred",
         "code": 500
     }), 500
 
@@ -490,23 +1040,18 @@ def score_company():
     """Mathematical scoring of single company - Requires API key authentication"""
     try:
         # Basic validation (from Context7 Flask patterns)
-        if not request.json:
-            abort(400, description="JSON payload required")
-
-        data = request.json
-        company_name = data.get('company_name')
-
-        if not company_name:
-            abort(400, description="company_name is required")
-
-        company_data = data.get('company_data', {})
+        data = _json_payload()
+        try:
+            company_name, company_data = validate_company(data.get('company_name'), data.get('company_data'))
+        except CompanyValidationError as e:
+            abort(400, description=str(e))
 
         # Mathematical scoring only
         result = scoring_engine.calculate_score(company_name, company_data)
 
         return jsonify({
             'success': True,
-            'result': asdict(result),
+            'result': result.to_dict(),
             'metadata': {
                 'api_version': '2.0-mathematical',
                 'scoring_type': 'mathematical_only',
@@ -515,70 +1060,38 @@ def score_company():
             }
         })
 
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    except HTTPException:
+        raise
+    except Exception:
+        app.logger.exception("Scoring request failed")
+        return jsonify({'success': False, 'error': 'Internal Server Error'}), 500
 
 
 @app.route('/score_batch', methods=['POST'])
 @require_api_key
 def score_batch():
     """Mathematical batch scoring - Requires API key authentication"""
-    try:
-        if not request.json:
-            abort(400, description="JSON payload required")
+    if _wants_ndjson(request):
+        return _stream_batch_ndjson()
 
-        data = request.json
+    try:
+        data = _json_payload()
         companies = data.get('companies', [])
 
         if not isinstance(companies, list) or not companies:
             abort(400, description="companies list is required and cannot be empty")
 
-        results = []
-        start_time = time.time()
-
-        for company_info in companies:
-            try:
-                # Handle different input formats
-                if isinstance(company_info, str):
-                    company_name = company_info
-                    company_data = {}
-                elif isinstance(company_info, dict):
-                    company_name = company_info.get('name', company_info.get('company_name', ''))
-                    company_data = company_info.get('data', company_info)
-                else:
-                    continue
+        start_ns = time.perf_counter_ns()
 
-                if not company_name:
-                    continue
-
-                # Mathematical scoring
-                result = scoring_engine.calculate_score(company_name, company_data)
-
-                results.append({
-                    'company_name': result.company_name,
-                    'base_score': result.base_score,
-                    'industry_adjusted_score': result.industry_adjusted_score,
-                    'priority_recommendation': result.priority_recommendation,
-                    'detected_industry': result.detected_industry,
-                    'industry_multiplier': result.industry_multiplier,
-                    'confidence': result.industry_confidence
-                })
-
-            except Exception as e:
-                results.append({
-                    'company_name': company_name if 'company_name' in locals() else 'Unknown',
-                    'base_score': 0,
-                    'industry_adjusted_score': 0,
-                    'priority_recommendation': 'error',
-                    'error': str(e)
-                })
+        results = _score_batch_companies(companies)
 
         # Sort by mathematical score
-        results.sort(key=lambda x: x.get('industry_adjusted_score', 0), reverse=True)
+        results.sort(key=operator.itemgetter('industry_adjusted_score'), reverse=True)
 
-        # Mathematical statistics
-        target_count = len([r for r in results if r.get('priority_recommendation') == 'target'])
-        processing_time = int((time.time() - start_time) * 1000)
+        # Mathematical statistics (single pass over sorted results)
+        targets = [r for r in results if r['priority_recommendation'] == 'target']
+        target_count = len(targets)
+        processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         return jsonify({
             'success': True,
@@ -588,7 +1101,7 @@ def score_batch():
                 'target_recommendations': target_count,
                 'non_target_recommendations': len(results) - target_count,
                 'processing_time_ms': processing_time,
-                'top_targets': [r for r in results if r.get('priority_recommendation') == 'target'][:10]
+                'top_targets': targets[:10]
             },
             'metadata': {
                 'api_version': '2.0-mathematical',
@@ -597,13 +1110,16 @@ def score_batch():
             }
         })
 
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    except HTTPException:
+        raise
+    except Exception:
+        app.logger.exception("Scoring request failed")
+        return jsonify({'success': False, 'error': 'Internal Server Error'}), 500
 
 
-@app.route('/industries', methods=['GET'])
-def get_industries():
-    """Get mathematical industry multipliers - Public access"""
+# Static GET bodies, serialized once at startup (industry table and API info never change)
+def _industries_payload() -> Dict[str, Any]:
+    """Industry multipliers listing served by /industries"""
     industries = {}
     for industry, data in scoring_engine.industry_modifiers.items():
         industries[industry] = {
@@ -612,8 +1128,8 @@ def get_industries():
             'reasoning': data['reasoning'],
             'keywords': data['keywords'][:5]  # Limit for response size
         }
-    
-    return jsonify({
+
+    return {
         'success': True,
         'industries': industries,
         'metadata': {
@@ -622,38 +1138,81 @@ def get_industries():
             'target_threshold': 60,
             'scoring_type': 'mathematical_only'
         }
+    }
+
+
+_INDUSTRIES_BODY = app.json.dumps(_industries_payload())
+
+_API_INFO_BODY = app.json.dumps({
+    'name': 'Yolwise Lead Scoring API',
+    'version': '2.0-mathematical',
+    'description': 'Turkish B2B market mathematical scoring - NO LLM logic',
+    'authentication': {
+        'required_endpoints': ['/score_company', '/score_batch', '/cache_stats'],
+        'public_endpoints': ['/health', '/industries', '/'],
+        'methods': [
+            'Header: X-API-Key: your-api-key',
+            'Query parameter: ?api_key=your-api-key'
+        ],
+        'environment_variable': 'YOLWISE_API_KEY'
+    },
+    'endpoints': {
+        '/health': 'GET - Health check (public)',
+        '/score_company': 'POST - Score single company (requires API key)',
+        '/score_batch': 'POST - Score multiple companies (requires API key)',
+        '/industries': 'GET - List supported industries with multipliers (public)',
+        '/cache_stats': 'GET - Scoring cache hit rates (requires API key)',
+        '/': 'GET - This API information (public)'
+    },
+    'scoring_approach': 'Mathematical only - no AI/LLM components',
+    'target_threshold': 60,
+    'specification': 'Turkish B2B market adapted from Smartway mathematical model'
+})
+
+
+# Content ETags of the static bodies (conditional GETs are answered with 304)
+_INDUSTRIES_ETAG = hashlib.blake2b(_INDUSTRIES_BODY.encode('utf-8'), digest_size=8).hexdigest()
+_API_INFO_ETAG = hashlib.blake2b(_API_INFO_BODY.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _static_json_response(body: str, etag: str) -> Response:
+    """Prebuilt JSON body with its ETag; a matching If-None-Match gets an empty 304"""
+    response = Response(body, mimetype=app.json.mimetype)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
+
+
+@app.route('/industries', methods=['GET'])
+def get_industries():
+    """Get mathematical industry multipliers - Public access"""
+    return _static_json_response(_INDUSTRIES_BODY, _INDUSTRIES_ETAG)
+
+
+@app.route('/cache_stats', methods=['GET'])
+@require_api_key
+def cache_stats():
+    """Scoring cache statistics of the serving worker - Requires API key authentication"""
+    return jsonify({
+        'success': True,
+        'pid': os.getpid(),
+        'caches': scoring_engine.cache_stats()
     })
 
 
 @app.route('/', methods=['GET'])
 def api_info():
     """API information - Public access"""
-    return jsonify({
-        'name': 'Yolwise Lead Scoring API',
-        'version': '2.0-mathematical',
-        'description': 'Turkish B2B market mathematical scoring - NO LLM logic',
-        'authentication': {
-            'required_endpoints': ['/score_company', '/score_batch'],
-            'public_endpoints': ['/health', '/industries', '/'],
-            'methods': [
-                'Header: X-API-Key: your-api-key',
-                'Query parameter: ?api_key=your-api-key'
-            ],
-            'environment_variable': 'YOLWISE_API_KEY'
-        },
-        'endpoints': {
-            '/health': 'GET - Health check (public)',
-            '/score_company': 'POST - Score single company (requires API key)',
-            '/score_batch': 'POST - Score multiple companies (requires API key)',
-            '/industries': 'GET - List supported industries with multipliers (public)',
-            '/': 'GET - This API information (public)'
-        },
-        'scoring_approach': 'Mathematical only - no AI/LLM components',
-        'target_threshold': 60,
-        'specification': 'Turkish B2B market adapted from Smartway mathematical model'
-    })
+    return _static_json_response(_API_INFO_BODY, _API_INFO_ETAG)
 
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=False)
+
+    if os.environ.get('DEV'):
+        # Werkzeug development server (single process, local use only)
+        app.run(host='0.0.0.0', port=port, debug=False)
+    else:
+        # Production WSGI server, configured by gunicorn.conf.py
+        os.execvp('gunicorn', ['gunicorn', 'main:app'])
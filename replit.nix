@@ -4,5 +4,6 @@
     pkgs.python311Packages.pip
     pkgs.python311Packages.flask
     pkgs.python311Packages.werkzeug
+    pkgs.python311Packages.gunicorn
   ];
 }
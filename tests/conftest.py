@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+# main.py reads the API key at import time
+os.environ.setdefault('YOLWISE_API_KEY', 'test-api-key')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    return main.app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_headers():
+    return {'X-API-Key': main._EXPECTED_API_KEY}
+
+
+@pytest.fixture
+def engine():
+    """Fresh scoring engine (empty caches)"""
+    return main.YolwiseScoring()
@@ -0,0 +1,20 @@
+import pytest
+
+
+@pytest.mark.parametrize('headers, query', [
+    ({}, ''),
+    ({'X-API-Key': 'wrong-key'}, ''),
+    ({'X-API-Key': 'test-api-ke'}, ''),
+    ({}, '?api_key=wrong-key'),
+])
+def test_scoring_requires_api_key(client, headers, query):
+    response = client.post('/score_company' + query, headers=headers, json={'company_name': 'Acme'})
+
+    assert response.status_code == 401
+
+
+def test_api_key_accepted_from_header_or_query(client, auth_headers):
+    api_key = auth_headers['X-API-Key']
+
+    assert client.post('/score_company', headers=auth_headers, json={'company_name': 'Acme'}).status_code == 200
+    assert client.post(f'/score_company?api_key={api_key}', json={'company_name': 'Acme'}).status_code == 200
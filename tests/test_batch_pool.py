@@ -0,0 +1,41 @@
+from concurrent.futures.process import BrokenProcessPool
+
+import main
+
+
+def test_broken_batch_pool_falls_back_in_process(client, auth_headers, monkeypatch):
+    class BrokenPool:
+        shut_down = False
+
+        def map(self, fn, shards):
+            raise BrokenProcessPool('child died')
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            self.shut_down = True
+
+    pool = BrokenPool()
+    monkeypatch.setattr(main, 'BATCH_POOL_WORKERS', 2)
+    monkeypatch.setattr(main, '_batch_pool', pool)
+    companies = [f'Acme {i}' for i in range(main.PARALLEL_BATCH_THRESHOLD + 1)]
+
+    response = client.post('/score_batch', headers=auth_headers, json={'companies': companies})
+
+    assert response.status_code == 200
+    assert response.get_json()['summary']['total_companies'] == len(companies)
+    assert main._batch_pool is None
+    assert pool.shut_down
+
+
+def test_one_worker_per_core_scores_in_process(client, auth_headers, monkeypatch):
+    # Default gunicorn sizing (WEB_CONCURRENCY=cpu_count) leaves no cores for a pool
+    def no_pool():
+        raise AssertionError('batch pool should not be used')
+
+    monkeypatch.setattr(main, 'BATCH_POOL_WORKERS', 1)
+    monkeypatch.setattr(main, '_get_batch_pool', no_pool)
+    companies = [f'Acme {i}' for i in range(main.PARALLEL_BATCH_THRESHOLD + 1)]
+
+    response = client.post('/score_batch', headers=auth_headers, json={'companies': companies})
+
+    assert response.status_code == 200
+    assert response.get_json()['summary']['total_companies'] == len(companies)
@@ -0,0 +1,31 @@
+import json
+
+import pytest
+
+import main
+
+NDJSON = {'Accept': 'application/x-ndjson'}
+
+
+def _ndjson_lines(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+@pytest.mark.skipif(main.ijson is None, reason='NDJSON is only streamed with ijson installed')
+def test_body_size_cap_exempts_ndjson_stream(client, auth_headers, app, monkeypatch):
+    monkeypatch.setitem(app.config, 'MAX_CONTENT_LENGTH', 1000)
+    payload = {'companies': ['Acme A.Ş.'] * 200}
+
+    assert client.post('/score_batch', headers=auth_headers, json=payload).status_code == 413
+    streamed = client.post('/score_batch', headers={**auth_headers, **NDJSON}, json=payload)
+    assert streamed.status_code == 200
+    assert _ndjson_lines(streamed)[-1]['summary']['total_companies'] == 200
+
+
+def test_body_size_cap_applies_to_ndjson_without_ijson(client, auth_headers, app, monkeypatch):
+    # Without ijson the NDJSON path buffers the whole body, so the cap must still apply
+    monkeypatch.setitem(app.config, 'MAX_CONTENT_LENGTH', 1000)
+    monkeypatch.setattr(main, 'ijson', None)
+    payload = {'companies': ['Acme A.Ş.'] * 200}
+
+    assert client.post('/score_batch', headers={**auth_headers, **NDJSON}, json=payload).status_code == 413
@@ -0,0 +1,14 @@
+def test_cache_stats(client, auth_headers):
+    client.post('/score_company', headers=auth_headers, json={'company_name': 'Cache Probe Ltd.'})
+    client.post('/score_company', headers=auth_headers, json={'company_name': 'Cache Probe Ltd.'})
+
+    body = client.get('/cache_stats', headers=auth_headers).get_json()
+    assert body['success'] is True
+    assert set(body['caches']) == {'score', 'industry_detection'}
+    assert body['caches']['score']['hits'] >= 1
+    assert set(body['caches']['score']) == {'hits', 'misses', 'maxsize', 'currsize'}
+
+
+def test_cache_stats_requires_api_key(client):
+    assert client.get('/cache_stats').status_code == 401
+
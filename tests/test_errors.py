@@ -0,0 +1,22 @@
+import main
+
+
+def test_score_batch_hides_unexpected_row_errors(client, auth_headers, monkeypatch):
+    def explode(company_name, company_data):
+        raise RuntimeError('internal detail')
+
+    monkeypatch.setattr(main.scoring_engine, 'calculate_score', explode)
+    response = client.post('/score_batch', headers=auth_headers, json={'companies': ['Acme']})
+
+    assert response.get_json()['results'][0]['error'] == 'Scoring failed'
+
+
+def test_score_company_hides_unexpected_errors(client, auth_headers, monkeypatch):
+    def explode(company_name, company_data):
+        raise RuntimeError('internal detail')
+
+    monkeypatch.setattr(main.scoring_engine, 'calculate_score', explode)
+    response = client.post('/score_company', headers=auth_headers, json={'company_name': 'Acme'})
+
+    assert response.status_code == 500
+    assert response.get_json() == {'success': False, 'error': 'Internal Server Error'}
@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.mark.parametrize('city, expected', [
+    ('Istanbul', 70),
+    ('Kayseri', 65),
+    ('van', 60),
+    ('Kocaeli/Gebze', 62),
+    ('istanbul bölgesi', 70),
+    ('Erivan', 50),      # contains "van" but is not a tier city
+    ('', 50),
+])
+def test_city_tiers_match_whole_tokens(engine, city, expected):
+    assert engine.calculate_score('Acme', {'city': city}).score_breakdown['geographic_score'] == expected
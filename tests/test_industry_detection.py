@@ -0,0 +1,34 @@
+import pytest
+
+
+@pytest.mark.parametrize('industry', [
+    'Chemicals', 'chemicals', ' CHEMICALS ', 'computer_software', 'computer software',
+    'Hospital & Health Care', 'Transportation/Trucking/Railroad', 'Mechanical or Industrial Engineering'
+])
+def test_canonical_industry_skips_keyword_scan(engine, industry):
+    expected = {
+        'chemicals': 'chemicals',
+        'computer_software': 'computer_software',
+        'computer software': 'computer_software',
+        'hospital & health care': 'hospital_healthcare',
+        'transportation/trucking/railroad': 'transportation_trucking',
+        'mechanical or industrial engineering': 'mechanical_industrial'
+    }[industry.strip().lower()]
+
+    # Description keywords point elsewhere; the canonical industry field wins
+    result = engine.calculate_score('Acme', {
+        'industry': industry,
+        'description': 'solar wind renewable green energy sustainability'
+    })
+
+    assert result.detected_industry == expected
+    assert engine.cache_stats()['industry_detection']['misses'] == 0
+
+
+def test_non_canonical_industry_uses_keywords(engine):
+    result = engine.calculate_score('Acme', {
+        'industry': 'Tech',
+        'description': 'software it digital technology programming'
+    })
+
+    assert result.detected_industry == 'computer_software'
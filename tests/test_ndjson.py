@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+NDJSON = {'Accept': 'application/x-ndjson'}
+
+
+def _ndjson_lines(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_ndjson_stream(client, auth_headers):
+    response = client.post('/score_batch', headers={**auth_headers, **NDJSON},
+                           json={'companies': ['Acme', {'company_name': 'Beta'}, 5]})
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    lines = _ndjson_lines(response)
+    assert [line['company_name'] for line in lines[:-1]] == ['Acme', 'Beta']
+    assert lines[-1]['success'] is True
+    assert lines[-1]['summary']['total_companies'] == 2
+
+
+@pytest.mark.parametrize('body', [
+    '[1, 2]', '{}', '{"other": 1}', '{"companies": []}', '{"companies": null}', '{"companies": "Acme"}', 'nope'
+])
+def test_ndjson_rejects_same_envelopes_as_buffered(client, auth_headers, body):
+    headers = {**auth_headers, 'Content-Type': 'application/json'}
+    buffered = client.post('/score_batch', data=body, headers=headers)
+    streamed = client.post('/score_batch', data=body, headers={**headers, **NDJSON})
+
+    assert buffered.status_code == 400
+    assert streamed.status_code == 400
+
+
+@pytest.mark.parametrize('accept, mimetype', [
+    ('application/x-ndjson', 'application/x-ndjson'),
+    ('application/json, application/x-ndjson;q=0.5', 'application/x-ndjson'),
+    ('application/x-ndjson;q=0, */*', 'application/json'),
+    ('*/*', 'application/json'),
+])
+def test_ndjson_negotiation_honours_q_values(client, auth_headers, accept, mimetype):
+    response = client.post('/score_batch', headers={**auth_headers, 'Accept': accept},
+                           json={'companies': ['Acme']})
+
+    assert response.status_code == 200
+    assert response.mimetype == mimetype
+
+
+def test_ndjson_rejects_non_json_content_type_like_buffered(client, auth_headers):
+    headers = {**auth_headers, 'Content-Type': 'text/plain'}
+    body = '{"companies": ["Acme"]}'
+    buffered = client.post('/score_batch', data=body, headers=headers)
+    streamed = client.post('/score_batch', data=body, headers={**headers, **NDJSON})
+
+    assert buffered.status_code == streamed.status_code == 415
+    assert streamed.get_json() == buffered.get_json()
@@ -0,0 +1,34 @@
+import pytest
+
+import main
+
+
+def test_keyword_detection_and_text_numbers(engine):
+    result = engine.calculate_score('Solar Wind Ltd.', {
+        'description': 'green energy and solar',
+        'city': 'Kocaeli/Gebze',
+        'number_of_employees': '250 employees',
+        'annual_revenue': '45000000',
+        'year_founded': main._CURRENT_YEAR - 6
+    })
+
+    assert result.detected_industry == 'renewables_environment'
+    assert result.base_score == 53.7
+    assert result.industry_adjusted_score == 64.4
+    assert result.score_breakdown['geographic_score'] == 62  # industrial region token
+
+
+@pytest.mark.parametrize('value, expected', [
+    (12, 12.0), (3.5, 3.5), ('45000000', 45000000.0), ('approx 1.5 million', 1.5),
+    ('n/a', 0), (None, 0),
+])
+def test_safe_float(engine, value, expected):
+    assert engine._safe_float(value) == expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    (250, 250), ('about 40', 40), ('5 bin', 5000), ('2k', 2000), ('1.5 milyon', 1500000),
+    ('3m', 3000000), ('none', 0), (None, 0),
+])
+def test_extract_number(engine, value, expected):
+    assert engine._extract_number(value) == expected
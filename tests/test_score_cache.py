@@ -0,0 +1,58 @@
+import main
+
+
+def test_reference_company_scores(engine):
+    result = engine.calculate_score('Arçelik A.Ş.', {
+        'industry': 'Chemicals',
+        'description': 'Leading home appliances manufacturer in Turkey with international '
+                       'operations and innovative technology solutions.',
+        'city': 'Istanbul',
+        'number_of_employees': 5000,
+        'annual_revenue': 1e9,
+        'year_founded': 1955,
+        'company_domain_name': 'arcelik.com',
+        'phone_number': '123'
+    })
+
+    assert result.base_score == 80.5
+    assert result.industry_adjusted_score == 84.5
+    assert result.detected_industry == 'chemicals'
+    assert result.industry_multiplier == 1.05
+    assert result.priority_recommendation == 'target'
+    assert result.score_breakdown == {
+        'company_size_score': 85,
+        'industry_propensity_score': 85,
+        'financial_capacity_score': 70,
+        'geographic_score': 70,
+        'additional_score': 85
+    }
+
+
+def test_empty_company_defaults(engine):
+    result = engine.calculate_score('Foo', {})
+
+    assert result.detected_industry == 'other'
+    assert result.industry_multiplier == 1.0
+    assert result.base_score == 34.5
+    assert result.priority_recommendation == 'non_target'
+
+
+def test_score_cache_hits_return_independent_breakdowns(engine):
+    first = engine.calculate_score('Acme', {'industry': 'Retail'})
+    second = engine.calculate_score('ACME', {'industry': 'retail'})
+
+    assert engine.cache_stats()['score'] == {'hits': 1, 'misses': 1, 'maxsize': 4096, 'currsize': 1}
+    assert second.company_name == 'ACME'
+    assert second.score_breakdown == first.score_breakdown
+    assert second.score_breakdown is not first.score_breakdown
+
+
+def test_long_text_bypasses_caches(engine):
+    data = {'industry': 'Tech', 'description': 'software ' * main.MAX_CACHED_TEXT_LENGTH}
+    first = engine.calculate_score('Acme', data)
+    second = engine.calculate_score('Acme', data)
+
+    assert second.detected_industry == first.detected_industry == 'computer_software'
+    assert second.industry_adjusted_score == first.industry_adjusted_score
+    stats = engine.cache_stats()
+    assert stats['score']['currsize'] == stats['industry_detection']['currsize'] == 0
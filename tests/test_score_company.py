@@ -0,0 +1,14 @@
+def test_score_company(client, auth_headers):
+    response = client.post('/score_company', headers=auth_headers, json={
+        'company_name': 'Acme Lojistik A.Ş.',
+        'company_data': {'industry': 'Logistics and Supply Chain', 'city': 'Istanbul'}
+    })
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['success'] is True
+    assert body['result']['detected_industry'] == 'logistics_supply_chain'
+    assert set(body['result']['score_breakdown']) == {
+        'company_size_score', 'industry_propensity_score', 'financial_capacity_score',
+        'geographic_score', 'additional_score'
+    }
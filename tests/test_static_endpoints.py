@@ -0,0 +1,28 @@
+import pytest
+
+import main
+
+
+def test_industries_listing(client):
+    industries = client.get('/industries').get_json()['industries']
+
+    assert len(industries) == len(main.scoring_engine.industry_modifiers)
+    assert industries['chemicals']['multiplier'] == 1.05
+    assert len(industries['chemicals']['keywords']) <= 5
+
+
+def test_precomputed_industries_body_matches_engine(app):
+    assert app.json.loads(main._INDUSTRIES_BODY) == main._industries_payload()
+
+
+@pytest.mark.parametrize('path', ['/industries', '/'])
+def test_static_endpoints_revalidate_with_etag(client, path):
+    response = client.get(path)
+    etag = response.headers['ETag']
+
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'public, max-age=3600'
+    revalidated = client.get(path, headers={'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert revalidated.get_data() == b''
+    assert client.get(path, headers={'If-None-Match': '"stale"'}).status_code == 200
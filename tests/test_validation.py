@@ -0,0 +1,47 @@
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize('name, data, message', [
+    ('', {}, 'company_name is required'),
+    (42, {}, 'company_name must be a string'),
+    ('x' * (main.MAX_COMPANY_NAME_LENGTH + 1), {}, 'company_name must be at most 200 characters'),
+    ('Acme', [1], 'company_data must be a JSON object'),
+])
+def test_validate_company_rejects(name, data, message):
+    with pytest.raises(main.CompanyValidationError, match=message):
+        main.validate_company(name, data)
+
+
+def test_validate_company_defaults_missing_data():
+    assert main.validate_company('Acme', None) == ('Acme', {})
+
+
+@pytest.mark.parametrize('payload, message', [
+    ({'company_name': 'x' * 201}, 'company_name must be at most 200 characters'),
+    ({'company_name': 42}, 'company_name must be a string'),
+    ({'company_name': 'Acme', 'company_data': [1]}, 'company_data must be a JSON object'),
+    ({'company_data': {}}, 'company_name is required'),
+    ([1, 2], 'JSON payload required'),
+])
+def test_score_company_validation_errors(client, auth_headers, payload, message):
+    response = client.post('/score_company', headers=auth_headers, json=payload)
+
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Bad Request', 'message': message, 'code': 400}
+
+
+def test_score_batch_error_rows(client, auth_headers):
+    response = client.post('/score_batch', headers=auth_headers, json={
+        'companies': ['Acme', 'x' * 201, {'company_name': 'Beta', 'data': [1]}, 7]
+    })
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert len(results) == 3  # non-str/non-object entries are skipped
+    errors = {r['company_name'][:10]: r.get('error') for r in results if r['priority_recommendation'] == 'error'}
+    assert errors == {
+        'xxxxxxxxxx': 'company_name must be at most 200 characters',
+        'Beta': 'company_data must be a JSON object'
+    }